@@ -0,0 +1,127 @@
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_app(mp: pytest.MonkeyPatch, name: str = "portfolio_app"):
+    """Run app.py in Streamlit bare mode (no runtime: st.stop() is a no-op)."""
+    # Both set, so config never falls through to st.secrets (no secrets.toml here)
+    mp.setenv("ACCESS_CODE", "test")
+    mp.setenv("ACCESS_CODE_HASH", "$2b$04$" + "a" * 53)
+    mp.delenv("DRAWIO_WRAPPER", raising=False)  # default full-export rendering
+    mp.chdir(ROOT)
+    spec = importlib.util.spec_from_file_location(name, ROOT / "app.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def app():
+    with pytest.MonkeyPatch.context() as mp:  # env and cwd are restored after import
+        return load_app(mp)
+
+
+MX = b'<div class="mxgraph" style="max-width:100%" data-mxgraph="{&quot;nav&quot;:true}"></div>'
+
+
+@pytest.mark.parametrize("doc", [
+    # .mxgraph CSS rule in <head>, then an unrelated div before the diagram
+    b"<html><head><style>.mxgraph{border:0}</style></head><body><div id=x></div>" + MX + b"</body></html>",
+    # CSS rule with the diagram div closing first
+    b"<style>.mxgraph{}</style>" + MX,
+    # marker inside a comment ahead of the div
+    b"<body><!-- mxgraph -->" + MX + b"</body>",
+    # wrapper whose class only contains the marker as a prefix
+    b'<div class="mxgraph-wrap">' + MX + b"</div>",
+])
+def test_extract_matches_regex_search(app, doc):
+    expected = app._MXGRAPH_DIV_RE.search(doc)
+    assert expected is not None
+    assert app._extract_mxgraph_div(doc) == expected.group(1) == MX
+
+
+def test_extract_is_case_insensitive(app):
+    doc = b'<BODY><DIV CLASS="MXGRAPH" DATA-MXGRAPH="{}"></DIV></BODY>'
+    assert app._extract_mxgraph_div(doc) == b'<DIV CLASS="MXGRAPH" DATA-MXGRAPH="{}"></DIV>'
+
+
+def test_extract_many_markers_is_linear(app):
+    # One huge tag full of markers, then the real div
+    doc = b"<div " + b"mxgraph " * 20000 + b"></div>" + MX
+    start = time.perf_counter()
+    assert app._extract_mxgraph_div(doc) == MX
+    assert time.perf_counter() - start < 1.0
+
+
+def test_extract_none_without_div(app):
+    assert app._extract_mxgraph_div(b"<html><style>.mxgraph{}</style><div></div></html>") is None
+    assert app._extract_mxgraph_div(b"<html>none</html>") is None
+
+
+def test_extract_finds_div_in_every_asset(app):
+    for p in sorted((ROOT / "assets").glob("*.html")):
+        raw = p.read_bytes()
+        m = app._MXGRAPH_DIV_RE.search(raw)
+        assert app._extract_mxgraph_div(raw) == (m.group(1) if m else None), p.name
+
+
+def test_extract_falls_back_to_re_without_re2():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "re2", None)  # import re2 -> ImportError
+        app_re = load_app(mp, "portfolio_app_re")
+    assert app_re._re is re
+    for doc in (b"<style>.mxgraph{}</style>" + MX, b"<div " + b"mxgraph " * 20000 + b"></div>" + MX):
+        start = time.perf_counter()
+        assert app_re._extract_mxgraph_div(doc) == MX
+        assert time.perf_counter() - start < 1.0
+
+
+BASE = b'<base href="https://viewer.diagrams.net/">'
+
+
+@pytest.mark.parametrize("pad", [0, 20000])  # head inside / past the scanned prologue
+def test_inject_base_tag(app, pad):
+    prologue = b"\xef\xbb\xbf<!-- " + b"x" * pad + b" -->"
+    doc = prologue + b"<html><HEAD><style>.a{}</style></HEAD><body></body></html>"
+    assert app._inject_base_tag(doc) == prologue + b"<html><HEAD>" + BASE + doc[len(prologue) + 12:]
+    # already has one: left alone
+    with_base = prologue + b"<html><head><style>" + b"y" * pad + b"</style><BASE href=x></head></html>"
+    assert app._inject_base_tag(with_base) == with_base
+
+
+def test_full_export_is_default(app):
+    assert not app.DRAWIO_WRAPPER
+    for p in sorted((ROOT / "assets").glob("*.html")):
+        raw = p.read_bytes()
+        doc, scrolling = app._parse_drawio(raw)
+        assert scrolling
+        assert doc == str(app._inject_base_tag(raw), "utf-8", "ignore")
+        assert doc.count(BASE.decode()) == 1, p.name
+
+
+def test_missing_asset_shows_warning(tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    (tmp_path / "app.py").write_bytes((ROOT / "app.py").read_bytes())
+    (tmp_path / "assets").mkdir()
+    for p in (ROOT / "assets").glob("*.html"):
+        if p.name != "fe_before.html":
+            (tmp_path / "assets" / p.name).symlink_to(p)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DRAWIO_WRAPPER", raising=False)
+    at = AppTest.from_file(str(tmp_path / "app.py"), default_timeout=60)
+    at.secrets["ACCESS_CODE"] = "test"
+    at.secrets["ACCESS_CODE_HASH"] = ""
+    at.session_state["authed"] = True
+    at.run()
+    assert not at.exception
+    assert [w.value for w in at.warning] == ["Diagram not found or unreadable: assets/fe_before.html"]
+    assert len(at.get("iframe")) == 5
+    assert not [m for m in at.markdown if "preload" in m.value]  # wrapper mode only